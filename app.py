@@ -3,6 +3,7 @@ import re
 import json
 import time
 import uuid
+import sched
 import hashlib
 import logging
 import asyncio
@@ -15,7 +16,8 @@ from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-from flask import Flask, request, jsonify, send_file, abort, send_from_directory
+from flask import Flask, request, jsonify, send_file, abort, send_from_directory, make_response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -27,6 +29,12 @@ import requests
 from bs4 import BeautifulSoup
 import validators
 
+# Fast JSON serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure comprehensive logging
 logging.basicConfig(
     level=logging.INFO,
@@ -42,6 +50,23 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for jsonify() and request parsing"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+if orjson:
+    app.json = OrjsonProvider(app)
+
 # Enhanced Configuration
 app.config.update({
     'SECRET_KEY': os.environ.get('SECRET_KEY', str(uuid.uuid4())),
@@ -61,6 +86,19 @@ app.config.update({
     'API_RATE_LIMIT': os.environ.get('API_RATE_LIMIT', '50 per minute'),
     'DOWNLOAD_RATE_LIMIT': os.environ.get('DOWNLOAD_RATE_LIMIT', '10 per minute'),
     
+    # Reverse proxy file offloading (nginx X-Accel-Redirect)
+    'USE_X_ACCEL': os.environ.get('X_ACCEL_REDIRECT') == '1',
+    'X_ACCEL_PREFIX': os.environ.get('X_ACCEL_PREFIX', '/internal/'),
+    
+    # Static assets (disable when the reverse proxy serves them directly)
+    'SERVE_STATIC': os.environ.get('SERVE_STATIC', '1') != '0',
+    'STATIC_MAX_AGE': int(os.environ.get('STATIC_MAX_AGE', 3600)),
+    
+    # Download cleanup
+    'CLEANUP_INTERVAL': int(os.environ.get('CLEANUP_INTERVAL', 3600)),
+    'CLEANUP_MAX_AGE': int(os.environ.get('CLEANUP_MAX_AGE', 3600)),
+    'HEALTH_REFRESH_INTERVAL': int(os.environ.get('HEALTH_REFRESH_INTERVAL', 300)),
+    
     # Security Configuration
     'CSRF_ENABLED': True,
     'WTF_CSRF_TIME_LIMIT': None,
@@ -100,8 +138,8 @@ except Exception as e:
     logger.warning(f"Rate limiter initialization failed: {e}")
     limiter = None
 
-# Thread pool for background tasks
-executor = ThreadPoolExecutor(max_workers=20)
+# Shared thread pool for background tasks (email, data saves)
+executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ninjax-bg')
 
 class CookieManager:
     """Enhanced Cookie Management System for All Platforms"""
@@ -171,6 +209,16 @@ class SecurityValidator:
     
     MAX_URL_LENGTH = 2048
     MAX_FILENAME_LENGTH = 255
+    
+    EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    
+    # Registered domain -> platform; any subdomain of these matches too
+    PLATFORM_DOMAINS = {
+        'youtube.com': 'youtube',
+        'youtu.be': 'youtube',
+        'instagram.com': 'instagram',
+        'facebook.com': 'facebook'
+    }
 
     @staticmethod
     def validate_url(url):
@@ -201,6 +249,36 @@ class SecurityValidator:
         except Exception as e:
             return False, f"URL validation error: {str(e)}"
 
+    @staticmethod
+    def detect_platform(url):
+        """Return the platform a URL's host belongs to, or None"""
+        try:
+            host = urlparse(url).hostname or ''
+        except ValueError:
+            return None
+        
+        # Walk the host's suffixes (m.facebook.com -> facebook.com -> com)
+        while host:
+            platform = SecurityValidator.PLATFORM_DOMAINS.get(host)
+            if platform:
+                return platform
+            host = host.partition('.')[2]
+        return None
+
+    @staticmethod
+    def validate_email(email):
+        """Validate email format"""
+        if not isinstance(email, str):
+            return False
+        
+        # Cheap structural check rejects most bad input before the regex runs
+        at = email.find('@')
+        dot = email.rfind('.')
+        if at < 1 or dot <= at + 1 or dot >= len(email) - 2:
+            return False
+        
+        return SecurityValidator.EMAIL_PATTERN.fullmatch(email) is not None
+
     @staticmethod
     def sanitize_filename(filename):
         """Enhanced filename sanitization"""
@@ -912,8 +990,12 @@ class ContactHandler:
             return False
 
     @staticmethod
-    def save_to_file(data_type, data):
-        """Save contact/feedback data with enhanced structure"""
+    def save_to_file(data_type, data, user_agent='', ip_address=None):
+        """Save contact/feedback data with enhanced structure
+        
+        Request metadata is passed in explicitly so this can run on the
+        background executor, outside the request context.
+        """
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"{data_type}_{timestamp}_{uuid.uuid4().hex[:8]}.json"
@@ -923,13 +1005,17 @@ class ContactHandler:
             enhanced_data = {
                 'type': data_type,
                 'timestamp': datetime.now().isoformat(),
-                'user_agent': request.headers.get('User-Agent', ''),
-                'ip_address': request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR')),
+                'user_agent': user_agent,
+                'ip_address': ip_address,
                 'data': data
             }
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(enhanced_data, f, indent=2, ensure_ascii=False)
+            if orjson:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(enhanced_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps(enhanced_data, indent=2, ensure_ascii=False))
 
             logger.info(f"Data saved: {filename}")
             return True
@@ -938,114 +1024,260 @@ class ContactHandler:
             logger.error(f"Error saving data: {str(e)}")
             return False
 
-# Enhanced security headers
-@app.after_request
-def enhance_security_headers(response):
-    """Add comprehensive security headers"""
-    response.headers.update({
-        'X-Content-Type-Options': 'nosniff',
-        'X-Frame-Options': 'DENY',
-        'X-XSS-Protection': '1; mode=block',
-        'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
-        'Content-Security-Policy': "default-src 'self'; script-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; style-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com https://fonts.googleapis.com; font-src 'self' https://fonts.gstatic.com; img-src 'self' data: https:; connect-src 'self' https:",
-        'Referrer-Policy': 'strict-origin-when-cross-origin',
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
-        'Access-Control-Max-Age': '3600'
-    })
-    return response
-
-# Static file serving
-@app.route('/')
-def serve_index():
-    """Serve the main HTML file"""
+# Background maintenance
+def cleanup_old_files(max_age=None):
+    """Remove downloaded files older than max_age seconds"""
+    max_age = max_age if max_age is not None else app.config['CLEANUP_MAX_AGE']
+    cutoff = time.time() - max_age
+    removed = 0
+    
     try:
-        return send_from_directory('.', 'index.html')
-    except FileNotFoundError:
-        return jsonify({
-            'success': False,
-            'error': 'Frontend files not found',
-            'api_status': 'online'
-        }), 404
-
-@app.route('/<path:filename>')
-def serve_static(filename):
-    """Serve static files"""
+        with os.scandir(app.config['DOWNLOAD_FOLDER']) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning(f"Could not remove {entry.path}: {e}")
+        
+        logger.info(f"Cleanup finished: {removed} old file(s) removed")
+    except Exception as e:
+        logger.error(f"Error during cleanup: {str(e)}")
+    
+    return removed
+
+def _json_bytes(obj):
+    """Serialize obj to UTF-8 JSON bytes"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def _json_body():
+    """Parse the raw request body as a JSON object, or return None"""
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None
+    
     try:
-        return send_from_directory('.', filename)
-    except FileNotFoundError:
-        return jsonify({'success': False, 'error': 'File not found'}), 404
-
-# Health check and status endpoints
-@app.route('/health')
-def health_check():
-    """Comprehensive health check with cookies status"""
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+    except ValueError:
+        return None
+    
+    return data if isinstance(data, dict) else None
+
+_now_iso_cache = (0, '')
+
+def _now_iso():
+    """UTC ISO timestamp for informational fields, recomputed at most once per second"""
+    global _now_iso_cache
+    now = int(time.time())
+    cached = _now_iso_cache
+    if cached[0] != now:
+        cached = (now, datetime.utcfromtimestamp(now).isoformat())
+        _now_iso_cache = cached
+    return cached[1]
+
+# Placeholder spliced with the current timestamp when /health is served
+_TIMESTAMP_PLACEHOLDER = b'%TIMESTAMP%'
+
+# Uptime is a JSON number, so its placeholder is swapped together with its quotes
+_UPTIME_PLACEHOLDER = '%UPTIME%'
+_UPTIME_FIELD = b'"%UPTIME%"'
+
+# Cached subsystem health, refreshed in the background instead of per request
+_status_lock = threading.Lock()
+_subsystem_status = {
+    'youtube': youtube_downloader is not None,
+    'instagram': instagram_downloader is not None,
+    'facebook': facebook_downloader is not None
+}
+_health_body = None
+_health_etag = None
+
+def refresh_subsystem_status():
+    """Re-probe downloaders, directories and cookies and rebuild the /health body"""
+    global _health_body, _health_etag
+    
     try:
-        # Check downloaders
         downloaders_status = {
             'youtube': youtube_downloader is not None,
             'instagram': instagram_downloader is not None,
             'facebook': facebook_downloader is not None
         }
         
-        # Check directories
         directories_status = {
             'download_folder': os.path.exists(app.config['DOWNLOAD_FOLDER']),
             'temp_folder': os.path.exists(app.config['TEMP_FOLDER']),
             'cookies_folder': os.path.exists(cookies_dir)
         }
         
-        # Check cookies status
         cookies_status = {}
         if cookie_manager:
             cookies_status = cookie_manager.get_cookies_status()
         
-        return jsonify({
+        body = _json_bytes({
             'status': 'healthy',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _TIMESTAMP_PLACEHOLDER.decode(),
             'version': '2.0.0',
             'environment': os.environ.get('FLASK_ENV', 'production'),
             'downloaders': downloaders_status,
             'directories': directories_status,
             'cookies': cookies_status,
-            'uptime': int(time.time()),
+            'uptime': _UPTIME_PLACEHOLDER,
             'python_version': f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}"
         })
+        
+        with _status_lock:
+            _subsystem_status.update(downloaders_status)
+            _health_body = body
+            _health_etag = hashlib.md5(body).hexdigest()
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error(f"Health status refresh failed: {e}")
+
+def _background_loop():
+    """Run periodic cleanup and health refresh on a single scheduler thread"""
+    scheduler = sched.scheduler(time.monotonic, time.sleep)
+    
+    def every(interval, task):
+        def run():
+            try:
+                task()
+            except Exception as e:
+                logger.error(f"Background task {task.__name__} failed: {e}")
+            finally:
+                scheduler.enter(interval, 1, run)
+        scheduler.enter(interval, 1, run)
+    
+    every(app.config['CLEANUP_INTERVAL'], cleanup_old_files)
+    every(app.config['HEALTH_REFRESH_INTERVAL'], refresh_subsystem_status)
+    scheduler.run()
+
+_background_started = False
+
+def start_background_tasks():
+    """Start the periodic maintenance thread in this process
+    
+    Threads do not survive fork, so under gunicorn this is called from
+    the post_fork hook in each worker rather than at import time.
+    """
+    global _background_started
+    if _background_started:
+        return
+    _background_started = True
+    
+    threading.Thread(target=_background_loop, name='ninjax-scheduler', daemon=True).start()
+
+refresh_subsystem_status()
+
+# Enhanced security headers (built once, applied to every response)
+_SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
+    'Referrer-Policy': 'strict-origin-when-cross-origin',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
+    'Access-Control-Max-Age': '3600'
+}
+
+_CONTENT_SECURITY_POLICY = "default-src 'self'; script-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; style-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com https://fonts.googleapis.com; font-src 'self' https://fonts.gstatic.com; img-src 'self' data: https:; connect-src 'self' https:"
+
+@app.after_request
+def enhance_security_headers(response):
+    """Add comprehensive security headers"""
+    response.headers.update(_SECURITY_HEADERS)
+    
+    # CSP only matters for documents the browser renders
+    if response.mimetype == 'text/html':
+        response.headers['Content-Security-Policy'] = _CONTENT_SECURITY_POLICY
+    return response
+
+# Static file serving
+@app.route('/')
+def serve_index():
+    """Serve the main HTML file"""
+    try:
+        return send_from_directory('.', 'index.html')
+    except FileNotFoundError:
+        return jsonify({
+            'success': False,
+            'error': 'Frontend files not found',
+            'api_status': 'online'
+        }), 404
+
+@app.route('/<path:filename>')
+def serve_static(filename):
+    """Serve static files with browser caching (ETag/conditional GET)"""
+    if not app.config['SERVE_STATIC']:
+        abort(404)
+    
+    try:
+        return send_from_directory('.', filename, max_age=app.config['STATIC_MAX_AGE'])
+    except FileNotFoundError:
+        return jsonify({'success': False, 'error': 'File not found'}), 404
+
+# Health check and status endpoints
+@app.route('/health')
+def health_check():
+    """Comprehensive health check with cookies status (served from cache)"""
+    with _status_lock:
+        body = _health_body
+        etag = _health_etag
+    
+    if body is None:
         return jsonify({
             'status': 'unhealthy',
-            'error': str(e),
-            'timestamp': datetime.utcnow().isoformat()
+            'error': 'Health status not available',
+            'timestamp': _now_iso()
         }), 500
+    
+    # Weak ETag: it tracks the snapshot, not the per-second timestamp in the body
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    
+    body = body.replace(_TIMESTAMP_PLACEHOLDER, _now_iso().encode(), 1)
+    body = body.replace(_UPTIME_FIELD, str(int(time.time())).encode(), 1)
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    return response
+
+# Static /api/status body, rendered once; only the timestamp changes per request
+_STATUS_BODY = _json_bytes({
+    'service': 'Downloader NinjaX API',
+    'version': '2.0.0',
+    'status': 'online',
+    'timestamp': _TIMESTAMP_PLACEHOLDER.decode(),
+    'endpoints': {
+        'analyze': '/api/analyze',
+        'download': '/api/download',
+        'contact': '/api/submit/contact',
+        'feedback': '/api/submit/feedback',
+        'file_download': '/api/file/<filename>',
+        'cookies_status': '/api/cookies/status',
+        'cookies_upload': '/api/cookies/upload',
+        'health': '/health'
+    },
+    'supported_platforms': ['youtube', 'instagram', 'facebook'],
+    'cookies_support': cookie_manager is not None,
+    'rate_limits': {
+        'analyze': '20 per minute',
+        'download': '10 per minute',
+        'contact': '5 per minute'
+    }
+})
 
 @app.route('/api/status')
 def api_status():
     """Detailed API status with cookies support"""
-    return jsonify({
-        'service': 'Downloader NinjaX API',
-        'version': '2.0.0',
-        'status': 'online',
-        'timestamp': datetime.utcnow().isoformat(),
-        'endpoints': {
-            'analyze': '/api/analyze',
-            'download': '/api/download',
-            'contact': '/api/submit/contact',
-            'feedback': '/api/submit/feedback',
-            'file_download': '/api/file/<filename>',
-            'cookies_status': '/api/cookies/status',
-            'cookies_upload': '/api/cookies/upload',
-            'health': '/health'
-        },
-        'supported_platforms': ['youtube', 'instagram', 'facebook'],
-        'cookies_support': cookie_manager is not None,
-        'rate_limits': {
-            'analyze': '20 per minute',
-            'download': '10 per minute',
-            'contact': '5 per minute'
-        }
-    })
+    body = _STATUS_BODY.replace(_TIMESTAMP_PLACEHOLDER, _now_iso().encode(), 1)
+    return app.response_class(body, mimetype='application/json')
 
 # Cookies API Endpoints
 @app.route('/api/cookies/status', methods=['GET'])
@@ -1064,7 +1296,7 @@ def cookies_status():
         return jsonify({
             'success': True,
             'cookies_status': status,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _now_iso()
         })
         
     except Exception as e:
@@ -1084,7 +1316,7 @@ def upload_cookies():
                 'error': 'Cookie manager not available'
             })
         
-        data = request.get_json()
+        data = _json_body()
         if not data or 'platform' not in data or 'cookies_content' not in data:
             return jsonify({
                 'success': False,
@@ -1109,6 +1341,9 @@ def upload_cookies():
         # Validate cookies
         is_valid = cookie_manager.validate_cookies(platform)
         
+        # Update cached health status with the new cookies
+        executor.submit(refresh_subsystem_status)
+        
         return jsonify({
             'success': True,
             'message': f'Cookies uploaded for {platform}',
@@ -1138,7 +1373,7 @@ def analyze_generic():
             return jsonify({'success': False, 'error': 'Rate limit exceeded'}), 429
     
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data or not all(k in data for k in ['url', 'platform']):
             return jsonify({
                 'success': False, 
@@ -1157,23 +1392,23 @@ def analyze_generic():
         result = None
         
         if platform == 'youtube':
-            if not youtube_downloader:
+            if not _subsystem_status['youtube']:
                 return jsonify({'success': False, 'error': 'YouTube downloader not available'}), 503
-            if not re.search(r'(youtube\.com|youtu\.be)', url):
+            if SecurityValidator.detect_platform(url) != platform:
                 return jsonify({'success': False, 'error': 'Invalid YouTube URL'}), 400
             result = youtube_downloader.get_video_info(url)
             
         elif platform == 'instagram':
-            if not instagram_downloader:
+            if not _subsystem_status['instagram']:
                 return jsonify({'success': False, 'error': 'Instagram downloader not available'}), 503
-            if not re.search(r'instagram\.com', url):
+            if SecurityValidator.detect_platform(url) != platform:
                 return jsonify({'success': False, 'error': 'Invalid Instagram URL'}), 400
             result = instagram_downloader.get_media_info(url)
             
         elif platform == 'facebook':
-            if not facebook_downloader:
+            if not _subsystem_status['facebook']:
                 return jsonify({'success': False, 'error': 'Facebook downloader not available'}), 503
-            if not re.search(r'facebook\.com', url):
+            if SecurityValidator.detect_platform(url) != platform:
                 return jsonify({'success': False, 'error': 'Invalid Facebook URL'}), 400
             result = facebook_downloader.get_media_info(url)
             
@@ -1207,7 +1442,7 @@ def download_generic():
             return jsonify({'success': False, 'error': 'Download rate limit exceeded'}), 429
     
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data or not all(k in data for k in ['url', 'platform']):
             return jsonify({
                 'success': False, 
@@ -1228,17 +1463,17 @@ def download_generic():
         result = None
         
         if platform == 'youtube':
-            if not youtube_downloader:
+            if not _subsystem_status['youtube']:
                 return jsonify({'success': False, 'error': 'YouTube downloader not available'}), 503
             result = youtube_downloader.download_video(url, format_id, quality)
             
         elif platform == 'instagram':
-            if not instagram_downloader:
+            if not _subsystem_status['instagram']:
                 return jsonify({'success': False, 'error': 'Instagram downloader not available'}), 503
             result = instagram_downloader.download_media(url)
             
         elif platform == 'facebook':
-            if not facebook_downloader:
+            if not _subsystem_status['facebook']:
                 return jsonify({'success': False, 'error': 'Facebook downloader not available'}), 503
             result = facebook_downloader.download_media(url)
             
@@ -1273,10 +1508,6 @@ def download_file(filename):
         
         filepath = os.path.join(app.config['DOWNLOAD_FOLDER'], safe_filename)
         
-        if not os.path.exists(filepath):
-            logger.warning(f"File not found: {filepath}")
-            return jsonify({'success': False, 'error': 'File not found'}), 404
-        
         # Security check - ensure file is within download folder
         abs_filepath = os.path.abspath(filepath)
         abs_download_folder = os.path.abspath(app.config['DOWNLOAD_FOLDER'])
@@ -1285,8 +1516,31 @@ def download_file(filename):
             logger.warning(f"Security violation - path traversal attempt: {filepath}")
             return jsonify({'success': False, 'error': 'Access denied'}), 403
         
+        # Single stat for existence, Last-Modified and ETag
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            logger.warning(f"File not found: {filepath}")
+            return jsonify({'success': False, 'error': 'File not found'}), 404
+        
         logger.info(f"Serving file: {safe_filename}")
-        return send_file(filepath, as_attachment=True, download_name=safe_filename)
+        
+        # Let nginx stream the bytes from disk instead of a gunicorn worker
+        if app.config['USE_X_ACCEL']:
+            response = make_response('')
+            response.headers['X-Accel-Redirect'] = f"{app.config['X_ACCEL_PREFIX']}{safe_filename}"
+            response.headers['Content-Disposition'] = f'attachment; filename="{safe_filename}"'
+            response.headers['Content-Type'] = 'application/octet-stream'
+            return response
+        
+        return send_file(
+            filepath,
+            as_attachment=True,
+            download_name=safe_filename,
+            conditional=True,
+            etag=f"{st.st_ino}-{st.st_size}-{int(st.st_mtime)}",
+            last_modified=st.st_mtime
+        )
         
     except Exception as e:
         logger.error(f"Error serving file {filename}: {str(e)}")
@@ -1306,7 +1560,7 @@ def submit_contact():
             return jsonify({'success': False, 'error': 'Rate limit exceeded'}), 429
     
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data:
             return jsonify({'success': False, 'error': 'No data provided'}), 400
 
@@ -1320,7 +1574,7 @@ def submit_contact():
             }), 400
 
         # Validate email format
-        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', data['email']):
+        if not SecurityValidator.validate_email(data['email']):
             return jsonify({'success': False, 'error': 'Invalid email format'}), 400
 
         # Prepare email content
@@ -1337,20 +1591,24 @@ def submit_contact():
         IP: {request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR'))}
         """
 
-        # Save to file
-        ContactHandler.save_to_file('contact', data)
+        # Save to file and send email in the background
+        executor.submit(
+            ContactHandler.save_to_file, 'contact', data,
+            request.headers.get('User-Agent', ''),
+            request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR'))
+        )
         
-        # Send email if configured
-        email_sent = False
+        email_queued = False
         if app.config.get('EMAIL_PASS'):
-            email_sent = ContactHandler.send_email(subject, body)
+            executor.submit(ContactHandler.send_email, subject, body)
+            email_queued = True
 
         logger.info(f"Contact form submitted by: {data['email']}")
         
         return jsonify({
             'success': True,
             'message': 'Contact form submitted successfully',
-            'email_sent': email_sent,
+            'email_queued': email_queued,
             'timestamp': datetime.now().isoformat()
         })
 
@@ -1371,7 +1629,7 @@ def submit_feedback():
             return jsonify({'success': False, 'error': 'Rate limit exceeded'}), 429
     
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data:
             return jsonify({'success': False, 'error': 'No data provided'}), 400
 
@@ -1399,7 +1657,7 @@ def submit_feedback():
 
         # Validate email if provided
         email = data.get('email', '')
-        if email and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
+        if email and not SecurityValidator.validate_email(email):
             return jsonify({'success': False, 'error': 'Invalid email format'}), 400
 
         # Prepare email content
@@ -1416,20 +1674,24 @@ def submit_feedback():
         IP: {request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR'))}
         """
 
-        # Save to file
-        ContactHandler.save_to_file('feedback', data)
+        # Save to file and send email in the background
+        executor.submit(
+            ContactHandler.save_to_file, 'feedback', data,
+            request.headers.get('User-Agent', ''),
+            request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR'))
+        )
         
-        # Send email if configured
-        email_sent = False
+        email_queued = False
         if app.config.get('EMAIL_PASS'):
-            email_sent = ContactHandler.send_email(subject, body)
+            executor.submit(ContactHandler.send_email, subject, body)
+            email_queued = True
 
         logger.info(f"Feedback submitted: {data['type']}")
         
         return jsonify({
             'success': True,
             'message': 'Feedback submitted successfully',
-            'email_sent': email_sent,
+            'email_queued': email_queued,
             'timestamp': datetime.now().isoformat()
         })
 
@@ -1492,5 +1754,7 @@ if __name__ == '__main__':
     logger.info(f"📘 Facebook downloader: {'✅ Ready' if facebook_downloader else '❌ Failed'}")
     logger.info("="*50)
     
+    start_background_tasks()
+    
     port = int(os.environ.get('PORT', 10000))
     app.run(debug=False, host='0.0.0.0', port=port)
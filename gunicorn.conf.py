@@ -1,3 +1,8 @@
+# Patch the stdlib for cooperative I/O before anything (including the app,
+# imported in each worker) imports socket, ssl or threading
+from gevent import monkey
+monkey.patch_all()
+
 import os
 import multiprocessing
 
@@ -5,14 +10,15 @@ import multiprocessing
 bind = f"0.0.0.0:{os.environ.get('PORT', 10000)}"
 backlog = 2048
 
-# Worker processes
-workers = min(multiprocessing.cpu_count() * 2 + 1, 8)
-worker_class = "gthread"
-threads = 2
+# Worker processes (gevent: each worker multiplexes many I/O-bound requests)
+workers = max(2, min(multiprocessing.cpu_count(), 4))
+worker_class = "gevent"
 worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 50
-preload_app = True
+# No preload: importing the app in the master would create gevent-patched
+# threads (Flask-Limiter's storage timer) that break in every forked worker
+preload_app = False
 
 # Restart workers after this many seconds
 timeout = 120
@@ -50,6 +56,8 @@ def pre_fork(server, worker):
 
 def post_fork(server, worker):
     server.log.info("Worker spawned (pid: %s)", worker.pid)
+    import app
+    app.start_background_tasks()
 
 def post_worker_init(worker):
     worker.log.info("Worker initialized")